@@ -0,0 +1,122 @@
+# Relative per-frame evaluation cost of the node types a ribbon rig is built from
+RIBBON_EVAL_COSTS = {
+    "follicle": 2.0,
+    "parentConstraint": 1.5,
+    "pointConstraint": 1.0,
+    "orientConstraint": 1.0,
+    "scaleConstraint": 1.0,
+    "animCurveUU": 0.25,
+    "animCurveUL": 0.25,
+    "animCurveUA": 0.25,
+    "animCurveTL": 0.25,
+    "animCurveTA": 0.25,
+    "animCurveTU": 0.25,
+    "transform": 0.1,
+    "joint": 0.15,
+    "nurbsCurve": 0.05,
+    "nurbsSurface": 0.5,
+    "groupParts": 0.2,
+    "groupId": 0.05,
+    "tweak": 0.5,
+    "remapValue": 0.1,
+    "setRange": 0.1,
+    "multDoubleLinear": 0.05,
+    "addDoubleLinear": 0.05,
+    "unitConversion": 0.05,
+}
+
+# Deformer cost scales with the number of surface CVs they process
+RIBBON_DEFORMER_CV_COSTS = {
+    "skinCluster": 0.05,
+    "blendShape": 0.03,
+    "nonLinear": 0.04,
+}
+
+# Node types that force serial/DG evaluation or block cached playback
+RIBBON_EVAL_BLOCKERS = {
+    "hairSystem": "dynamics node; forces serial evaluation and disables cached playback",
+    "nucleus": "dynamics solver; forces serial evaluation and disables cached playback",
+    "pfxHair": "paint effects output of a hairSystem; left over from doCreateHair",
+    "expression": "expression node; evaluated in the DG and blocks parallel evaluation",
+    "script": "script node; may run on time change",
+    "unknown": "unknown node; left over from a missing plugin",
+}
+
+# Maya is only imported when no backend is passed, so the audit runs against a stand-in outside Maya
+def getBackend(backend=None):
+    if backend is not None:
+        return backend
+    import maya.cmds as cmds
+    return cmds
+
+def getRibbonRigNodes(rigGroup="RibbonRig", backend=None):
+    mc = getBackend(backend)
+
+    # DAG nodes of the rig plus the DG history between them (deformers, SDK curves)
+    descendants = mc.listRelatives(rigGroup, allDescendents=True, fullPath=True) or []
+    nodes = set([rigGroup] + descendants)
+    nodes.update(mc.listHistory(descendants, pruneDagObjects=True) or [])
+
+    # Resolve every node type in a single query
+    typed = mc.ls(list(nodes), showType=True) or []
+    nodeTypes = dict(zip(typed[0::2], typed[1::2]))
+
+    # Constraints the rig drives on the FK chain sit outside the rig group
+    downstream = mc.listConnections(descendants, source=False, destination=True) or []
+    typed = mc.ls(list(set(downstream)), showType=True) or []
+    for node, nodeType in zip(typed[0::2], typed[1::2]):
+        if nodeType.endswith("Constraint"):
+            nodeTypes.setdefault(node, nodeType)
+
+    return nodeTypes
+
+def auditRibbonRig(rigGroup="RibbonRig", maxCost=None, backend=None):
+    mc = getBackend(backend)
+
+    if not mc.objExists(rigGroup):
+        mc.error(f"{rigGroup} does not exist.")
+
+    nodeTypes = getRibbonRigNodes(rigGroup, backend)
+
+    typeCounts = {}
+    for nodeType in nodeTypes.values():
+        typeCounts[nodeType] = typeCounts.get(nodeType, 0) + 1
+
+    flagged = [(n, t, RIBBON_EVAL_BLOCKERS[t]) for n, t in sorted(nodeTypes.items()) if t in RIBBON_EVAL_BLOCKERS]
+
+    # CV count of the surfaces the deformers run over
+    surfaceCVs = 0
+    for node, nodeType in nodeTypes.items():
+        if nodeType != "nurbsSurface" or mc.getAttr(node + ".intermediateObject"):
+            continue
+        cvsU = mc.getAttr(node + ".spansU") + mc.getAttr(node + ".degreeU")
+        cvsV = mc.getAttr(node + ".spansV") + mc.getAttr(node + ".degreeV")
+        surfaceCVs = max(surfaceCVs, cvsU * cvsV)
+
+    # Estimate the per-frame cost in relative units
+    estimatedCost = 0.0
+    for nodeType, count in typeCounts.items():
+        if nodeType in RIBBON_DEFORMER_CV_COSTS:
+            estimatedCost += RIBBON_DEFORMER_CV_COSTS[nodeType] * surfaceCVs * count
+        else:
+            estimatedCost += RIBBON_EVAL_COSTS.get(nodeType, 0.1) * count
+
+    report = {
+        "rigGroup": rigGroup,
+        "nodeCount": len(nodeTypes),
+        "typeCounts": typeCounts,
+        "flagged": flagged,
+        "surfaceCVs": surfaceCVs,
+        "estimatedCost": estimatedCost,
+        "overBudget": maxCost is not None and estimatedCost > maxCost,
+    }
+
+    print(f"\n{rigGroup}: {len(nodeTypes)} nodes, estimated cost {estimatedCost:.1f} per frame")
+    for nodeType, count in sorted(typeCounts.items(), key=lambda x: -x[1]):
+        print(f"    {nodeType}: {count}")
+    for node, nodeType, reason in flagged:
+        print(f"    WARNING {node} ({nodeType}): {reason}")
+    if report["overBudget"]:
+        print(f"    Over budget: {estimatedCost:.1f} > {maxCost}")
+
+    return report
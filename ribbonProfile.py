@@ -0,0 +1,83 @@
+import json
+
+# Report order of the ribbon stages
+RIBBON_PROFILE_STAGES = ["follicle attachment", "skin", "sine/twist", "constraints/space switch", "other"]
+
+def classifyRibbonNode(node, nodeType):
+    # Group rig nodes into the stages the profiler report compares
+    if nodeType in ("follicle",) or "Follicle" in node:
+        return "follicle attachment"
+    if nodeType.endswith("Constraint") or "Placement" in node:
+        return "constraints/space switch"
+    if nodeType in ("blendShape", "nonLinear", "deformSine", "deformTwist") or "Sine" in node or "Twist" in node or "Attribute_" in node:
+        return "sine/twist"
+    if nodeType in ("skinCluster", "tweak", "groupParts", "groupId", "dagPose", "nurbsSurface", "joint"):
+        return "skin"
+    return "other"
+
+def matchProfileNode(name, description, nodes):
+    # Events name the node directly or through a plug/path in the description
+    for text in (name, description):
+        if not text:
+            continue
+        if text in nodes:
+            return text
+        token = text.split(".")[0].split("|")[-1]
+        if token in nodes:
+            return token
+    return None
+
+def parseRibbonProfile(path):
+    with open(path, "r") as f:
+        capture = json.load(f)
+
+    nodes = capture.get("nodes", {})
+    frameCount = max(int(capture.get("frames", 1)), 1)
+
+    # Sum event durations (microseconds) per rig node
+    nodeTimes = {}
+    for name, description, duration in capture.get("events", []):
+        node = matchProfileNode(name, description, nodes)
+        if node is None:
+            continue
+        nodeTimes[node] = nodeTimes.get(node, 0.0) + float(duration)
+
+    stageTimes = {stage: 0.0 for stage in RIBBON_PROFILE_STAGES}
+    for node, duration in nodeTimes.items():
+        stage = nodes[node] if nodes[node] in stageTimes else "other"
+        stageTimes[stage] += duration
+
+    # Per-frame milliseconds and the fps the rig alone would allow
+    totalMs = sum(nodeTimes.values()) / 1000.0 / frameCount
+    report = {
+        "rigGroup": capture.get("rigGroup", ""),
+        "frames": frameCount,
+        "msPerFrame": totalMs,
+        "fps": 1000.0 / totalMs if totalMs > 0 else None,
+        "stages": {stage: t / 1000.0 / frameCount for stage, t in stageTimes.items()},
+        "nodes": {node: t / 1000.0 / frameCount for node, t in nodeTimes.items()},
+    }
+    return report
+
+def formatRibbonProfileReport(report, topNodes=10):
+    lines = []
+    fps = f"{report['fps']:.1f} fps" if report["fps"] else "n/a"
+    lines.append(f"{report['rigGroup']}: {report['msPerFrame']:.3f} ms/frame over {report['frames']} frames ({fps})")
+
+    lines.append("Stages (ms/frame):")
+    for stage in RIBBON_PROFILE_STAGES:
+        ms = report["stages"].get(stage, 0.0)
+        if ms:
+            lines.append(f"    {stage}: {ms:.3f}")
+
+    lines.append(f"Top {topNodes} nodes (ms/frame):")
+    for node, ms in sorted(report["nodes"].items(), key=lambda x: -x[1])[:topNodes]:
+        lines.append(f"    {node}: {ms:.3f}")
+
+    return "\n".join(lines)
+
+def writeRibbonProfileReport(report, path, topNodes=10):
+    text = formatRibbonProfileReport(report, topNodes)
+    with open(path, "w") as f:
+        f.write(text + "\n")
+    return text
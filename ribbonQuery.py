@@ -0,0 +1,103 @@
+from ribbonAudit import getBackend
+
+# Query layer, answers the hot build queries through OpenMaya with a cmds fallback
+# A passed backend always takes the cmds path, so the queries run against a stand-in outside Maya
+USE_OPENMAYA = True
+
+# Curve samples per knot interval when measuring a curved control's world bounding box
+CURVE_BBOX_SAMPLES = 2
+
+def getOpenMaya():
+    import maya.api.OpenMaya as om
+    return om
+
+def useOpenMaya(backend):
+    return backend is None and USE_OPENMAYA
+
+def getDagPath(node):
+    om = getOpenMaya()
+    sel = om.MSelectionList()
+    sel.add(node)
+    return sel.getDagPath(0)
+
+def queryAncestry(node, backend=None):
+    # (name, hasShapes) from node up to its root transform
+    ancestry = []
+    if useOpenMaya(backend):
+        path = getDagPath(node)
+        while path.length() > 0:
+            ancestry.append((path.partialPathName(), path.numberOfShapesDirectlyBelow() > 0))
+            path.pop()
+        return ancestry
+
+    mc = getBackend(backend)
+    while node:
+        ancestry.append((node, bool(mc.listRelatives(node, shapes=True))))
+        parent = mc.listRelatives(node, parent=True, type="transform")
+        node = parent[0] if parent else None
+    return ancestry
+
+def queryCurveBoundingBoxes(controls, backend=None):
+    # World bounding box of each control's first nurbsCurve shape, as exactWorldBoundingBox returns it
+    if not useOpenMaya(backend):
+        mc = getBackend(backend)
+        return [mc.exactWorldBoundingBox(mc.listRelatives(c, shapes=True, type="nurbsCurve")[0]) for c in controls]
+
+    om = getOpenMaya()
+    bboxes = []
+    for ctrl in controls:
+        path = getDagPath(ctrl)
+        for i in range(path.childCount()):
+            if path.child(i).hasFn(om.MFn.kNurbsCurve):
+                path.push(path.child(i))
+                break
+        else:
+            getBackend().error(f"{ctrl} has no nurbsCurve shape.")
+
+        # Degree 1 curves pass through their CVs, so the world CV hull is exact in one call
+        curveFn = om.MFnNurbsCurve(path)
+        if curveFn.degree == 1:
+            points = curveFn.cvPositions(om.MSpace.kWorld)
+        else:
+            # Evaluate at every knot and inside each knot interval, so uneven knots are still covered
+            start, end = curveFn.knotDomain
+            knots = sorted(set(k for k in curveFn.knots() if start <= k <= end))
+            params = [end]
+            for k0, k1 in zip(knots, knots[1:]):
+                params += [k0 + (k1 - k0) * i / CURVE_BBOX_SAMPLES for i in range(CURVE_BBOX_SAMPLES)]
+            points = [curveFn.getPointAtParam(t, om.MSpace.kWorld) for t in params]
+
+        xs = [p.x for p in points]
+        ys = [p.y for p in points]
+        zs = [p.z for p in points]
+        bboxes.append([min(xs), min(ys), min(zs), max(xs), max(ys), max(zs)])
+
+    return bboxes
+
+def queryFollicleParameterV(follicles, backend=None):
+    if not useOpenMaya(backend):
+        mc = getBackend(backend)
+        return [mc.getAttr(mc.listRelatives(f, shapes=True, fullPath=True)[0] + ".parameterV") for f in follicles]
+
+    om = getOpenMaya()
+    values = []
+    for follicle in follicles:
+        path = getDagPath(follicle)
+        path.extendToShape()
+        values.append(om.MFnDependencyNode(path.node()).findPlug("parameterV", False).asDouble())
+    return values
+
+def queryNodeTypes(nodes, backend=None):
+    if not useOpenMaya(backend):
+        mc = getBackend(backend)
+        return [mc.nodeType(n) for n in nodes]
+
+    # One entry per node, a shared selection list would merge repeats
+    om = getOpenMaya()
+    types = []
+    sel = om.MSelectionList()
+    for node in nodes:
+        sel.clear()
+        sel.add(node)
+        types.append(om.MFnDependencyNode(sel.getDependNode(0)).typeName)
+    return types
@@ -1,6 +1,80 @@
 import maya.cmds as cmds
 import maya.mel as mel
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
 import os
+import re
+import json
+import struct
+from array import array
+import ribbonProfile
+import ribbonAudit
+from ribbonAudit import auditRibbonRig
+from ribbonQuery import getDagPath, queryAncestry, queryCurveBoundingBoxes, queryFollicleParameterV, queryNodeTypes
+
+# Templates and anchor controls the build relies on
+RIBBON_TEMPLATE_FILES = ["Ctrl_Ribbon.ma", "Ctrl_Ribbon_Placement.ma", "Ctrl_X.ma"]
+RIBBON_BODY_CTRLS = ["tsm3_upper_body", "spine_C0_ik0_ctrl", "body_C0_ctrl", "world_ctrl"]
+
+# Fixed names the build creates, anything already using them breaks the build
+RIBBON_NODE_NAMES = ["RibbonRig", "c_Ribbon_Plane", "c_Ribbon_Plane_Sine", "c_Ribbon_Plane_Twist", "c_Ribbon_Plane_BS",
+                     "c_Ribbon_SkinCluster", "hairSystem1", "hairSystem1Follicles", "nucleus1", "pfxHair1",
+                     "Ctrl_Ribbon_Placement", "Ctrl_Ribbon_Placement_grp", "Attribute_Twist_Ctrl", "Attribute_Wave_Ctrl",
+                     "RibbonPlane_SineDefHandle", "RibbonPlane_TwistDefHandle"]
+RIBBON_NODE_PATTERNS = ["c_Follicle_*", "c_Follicle_Jt_*", "c_Ribbon_Jt_*", "Ribbon_Ctrl*"]
+
+def getRibbonTemplatePath(fileName):
+    projectRoot = cmds.workspace(q=True, rd=True).replace("\\", "/")
+    return projectRoot + "Characters/_Creatures/CreatureTest/ctrl/" + fileName
+
+def findBodyCtrl(transforms=None):
+    for name in RIBBON_BODY_CTRLS:
+        if cmds.objExists(name):
+            return name
+
+    if transforms is None:
+        transforms = cmds.ls(type="transform") or []
+    for needle in RIBBON_BODY_CTRLS:
+        matches = [w for w in transforms if needle.lower() in w.lower()]
+        if matches:
+            return sorted(matches, key=len)[0]  # prefer cleanest/shortest (good for namespaces)
+
+    return None
+
+def preflightRibbonRig(controlCount, weightsFile=None):
+    problems = []
+
+    # Chain controls need a curve shape to measure
+    if len(controlCount) < 2:
+        problems.append("The FK chain needs at least 2 controls.")
+    for ctrl in controlCount:
+        if not cmds.listRelatives(ctrl, shapes=True, type="nurbsCurve"):
+            problems.append(f"Chain control '{ctrl}' has no nurbsCurve shape.")
+
+    # Skin weights asked for explicitly
+    if weightsFile and not os.path.exists(weightsFile):
+        problems.append(f"Skin weights file not found: {weightsFile}")
+
+    # Template files
+    for fileName in RIBBON_TEMPLATE_FILES:
+        path = getRibbonTemplatePath(fileName)
+        if not os.path.exists(path):
+            problems.append(f"{fileName} not found at: {path}")
+
+    # Anchor controls for placement and the space switch
+    transforms = cmds.ls(type="transform") or []
+    if not findBodyCtrl(transforms):
+        problems.append("No body ctrl found (" + ", ".join(RIBBON_BODY_CTRLS) + ").")
+    if not [n for n in transforms if "world_ctrl" in n.lower()]:
+        problems.append("world_ctrl not found for world space switch.")
+
+    # Name collisions with an existing ribbon
+    existing = [n for n in RIBBON_NODE_NAMES if cmds.objExists(n)]
+    existing += cmds.ls(RIBBON_NODE_PATTERNS) or []
+    for node in existing:
+        problems.append(f"'{node}' already exists; remove or rename the existing RibbonRig first.")
+
+    return problems
 
 def countFKControls():
     sel = cmds.ls(sl=True)
@@ -8,22 +82,13 @@ def countFKControls():
         cmds.confirmDialog(title="Selection Error",message="Select exactly 2 controls, the first and last in the fk chain",button=["OK"],defaultButton="OK")
         cmds.error("Select exactly 2 controls, the first and last in the fk chain")
     start, end = cmds.ls(sl=True)
-    controlCount = []
-    origStart, origEnd = start, end
-
-    while end:
-        if cmds.listRelatives(end, shapes=True):
-            controlCount.append(end)
-        if end == start:
-            return controlCount
 
-        parent = cmds.listRelatives(end, parent=True, type="transform")
-        end = parent[0] if parent else None
-
-        if end is None and start == origStart:
-            start, end = origEnd, origStart
-            controlCount = []
-            continue 
+    # Walk up from the end control, then from the start if the selection was reversed
+    for first, last in ((start, end), (end, start)):
+        ancestry = queryAncestry(last)
+        names = [name for name, hasShapes in ancestry]
+        if first in names:
+            return [name for name, hasShapes in ancestry[:names.index(first) + 1] if hasShapes]
 
     cmds.confirmDialog(title="Selection Error",message="The selected controls are not in the same hierarchy chain",button=["OK"],defaultButton="OK")
     cmds.error("The selected controls are not in the same hierarchy chain")
@@ -34,11 +99,8 @@ def createPlane(controlCount):
     endCtrl   = controls[0]
 
     # Get world positions from control shapes
-    startShape = cmds.listRelatives(startCtrl, shapes=True, type="nurbsCurve")[0]
-    startBbox  = cmds.exactWorldBoundingBox(startShape)
+    startBbox, endBbox = queryCurveBoundingBoxes([startCtrl, endCtrl])
     startPos   = [(startBbox[0] + startBbox[3]) * 0.5,(startBbox[1] + startBbox[4]) * 0.5,(startBbox[2] + startBbox[5]) * 0.5]
-    endShape = cmds.listRelatives(endCtrl, shapes=True, type="nurbsCurve")[0]
-    endBbox  = cmds.exactWorldBoundingBox(endShape)
     endPos   = [(endBbox[0] + endBbox[3]) * 0.5,(endBbox[1] + endBbox[4]) * 0.5,(endBbox[2] + endBbox[5]) * 0.5]
 
     # Midpoint between start and end controls
@@ -111,7 +173,8 @@ def createFollicles(plane, controlCount):
 
     # Rename follicles
     follicles = cmds.listRelatives("hairSystem1Follicles", children=True, fullPath=True) or []
-    follicles = sorted(follicles,key=lambda f: cmds.getAttr(cmds.listRelatives(f, shapes=True, fullPath=True)[0] + ".parameterV"))
+    parameterV = dict(zip(follicles, queryFollicleParameterV(follicles)))
+    follicles = sorted(follicles,key=lambda f: parameterV[f])
     for i, f in enumerate(follicles, start=1):
         cmds.rename(f, "c_Follicle_%d" % i)
 
@@ -128,7 +191,8 @@ def createFollicleJoints(controlCount):
     follicles = cmds.listRelatives(follicleGroup, children=True, fullPath=True) or []
 
     # Sort follicles by parameterV
-    follicles = sorted(follicles,key=lambda f: cmds.getAttr(cmds.listRelatives(f, shapes=True, fullPath=True)[0] + ".parameterV"))
+    parameterV = dict(zip(follicles, queryFollicleParameterV(follicles)))
+    follicles = sorted(follicles,key=lambda f: parameterV[f])
 
     # Create the first joint
     baseJoint = cmds.joint(name="c_Follicle_Jt_1")
@@ -190,17 +254,15 @@ def createRibbonControlJoints(controlCount):
         joints.append(j)
 
     # Point-snap joints to corresponding FK control
-    for jnt, idx in zip(joints, indices):
-        ctrl = controls[idx]
-        shape = cmds.listRelatives(ctrl, shapes=True, type="nurbsCurve")[0]
-        bbox = cmds.exactWorldBoundingBox(shape)
+    bboxes = queryCurveBoundingBoxes([controls[idx] for idx in indices])
+    for jnt, bbox in zip(joints, bboxes):
         pos = [(bbox[0] + bbox[3]) * 0.5,(bbox[1] + bbox[4]) * 0.5,(bbox[2] + bbox[5]) * 0.5]
         cmds.xform(jnt, ws=True, t=pos)
         cmds.setAttr(jnt + ".rotate", 0, 0, 0, type="double3")
 
     return joints
 
-def bindRibbonSkin():
+def bindRibbonSkin(weightsFile=None):
     # Collect ribbon joints
     ribbonJoints = cmds.ls("c_Ribbon_Jt_*", type="joint")
     if not ribbonJoints:
@@ -243,10 +305,188 @@ def bindRibbonSkin():
     if cmds.objExists(skin + ".colorizeSkeleton"):
         cmds.setAttr(skin + ".colorizeSkeleton", 1)
 
+    # Restore painted weights from a previous build
+    if weightsFile:
+        if os.path.exists(weightsFile):
+            loadRibbonSkinWeights(weightsFile, plane, skin)
+        else:
+            cmds.warning(f"Skin weights file not found, keeping closest distance weights: {weightsFile}")
+
+RIBBON_WEIGHTS_MAGIC = b"RBNW"
+RIBBON_WEIGHTS_VERSION = 1
+
+def getRibbonSkinData(plane, skin):
+    sel = om.MSelectionList()
+    sel.add(skin)
+    skinFn = oma.MFnSkinCluster(sel.getDependNode(0))
+
+    shape = cmds.listRelatives(plane, shapes=True, type="nurbsSurface", noIntermediate=True, fullPath=True)[0]
+    shapePath = getDagPath(shape)
+    surfaceFn = om.MFnNurbsSurface(shapePath)
+    numU, numV = surfaceFn.numCVsInU, surfaceFn.numCVsInV
+
+    # Positions come from the undeformed orig shape so a posed or animated rig saves its bind positions
+    origFn = surfaceFn
+    for orig in cmds.listRelatives(plane, shapes=True, type="nurbsSurface", fullPath=True) or []:
+        if cmds.getAttr(orig + ".intermediateObject") and not cmds.listConnections(orig + ".create", source=True, destination=False):
+            origFn = om.MFnNurbsSurface(getDagPath(orig))
+            break
+
+    # Every CV, u major, matching the order positions are stored in
+    compFn = om.MFnDoubleIndexedComponent()
+    components = compFn.create(om.MFn.kSurfaceCVComponent)
+    positions = array("d")
+    for u in range(numU):
+        for v in range(numV):
+            compFn.addElement(u, v)
+            p = origFn.cvPosition(u, v, om.MSpace.kObject)
+            positions.extend((p.x, p.y, p.z))
+
+    influences = [path.partialPathName() for path in skinFn.influenceObjects()]
+    return skinFn, shapePath, components, numU, numV, positions, influences
+
+def saveRibbonSkinWeights(path, plane="c_Ribbon_Plane", skin="c_Ribbon_SkinCluster"):
+    skinFn, shapePath, components, numU, numV, positions, influences = getRibbonSkinData(plane, skin)
+    weights, influenceCount = skinFn.getWeights(shapePath, components)
+
+    # Header, CV positions, then the CV x influence weight matrix
+    header = json.dumps({"influences": influences, "numU": numU, "numV": numV}).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(RIBBON_WEIGHTS_MAGIC)
+        f.write(struct.pack("<II", RIBBON_WEIGHTS_VERSION, len(header)))
+        f.write(header)
+        positions.tofile(f)
+        array("f", weights).tofile(f)
+
+    print(f"Saved {numU * numV} x {influenceCount} skin weights to {path}")
+
+def loadRibbonSkinWeights(path, plane="c_Ribbon_Plane", skin="c_Ribbon_SkinCluster"):
+    with open(path, "rb") as f:
+        if f.read(4) != RIBBON_WEIGHTS_MAGIC:
+            cmds.error(f"{path} is not a ribbon skin weights file.")
+        version, headerLength = struct.unpack("<II", f.read(8))
+        if version != RIBBON_WEIGHTS_VERSION:
+            cmds.error(f"Unsupported ribbon skin weights version {version}.")
+        header = json.loads(f.read(headerLength).decode("utf-8"))
+        savedInfluences = header["influences"]
+        savedCount = header["numU"] * header["numV"]
+        savedPositions = array("d")
+        savedPositions.fromfile(f, savedCount * 3)
+        savedWeights = array("f")
+        savedWeights.fromfile(f, savedCount * len(savedInfluences))
+
+    skinFn, shapePath, components, numU, numV, positions, influences = getRibbonSkinData(plane, skin)
+
+    # Weights are keyed by joint name, joints the new chain no longer has are dropped
+    missing = [i for i in savedInfluences if i not in influences]
+    if missing:
+        cmds.warning("Skipping skin weights for joints missing from the skinCluster: " + ", ".join(missing))
+    kept = [(savedIndex, influences.index(i)) for savedIndex, i in enumerate(savedInfluences) if i in influences]
+
+    # Same grid reads straight across, otherwise take the nearest saved CV
+    cvCount = numU * numV
+    if (numU, numV) == (header["numU"], header["numV"]):
+        sourceCVs = list(range(cvCount))
+    else:
+        sourceCVs = []
+        for cv in range(cvCount):
+            x, y, z = positions[cv * 3:cv * 3 + 3]
+            distances = [(savedPositions[i * 3] - x) ** 2 + (savedPositions[i * 3 + 1] - y) ** 2 + (savedPositions[i * 3 + 2] - z) ** 2 for i in range(savedCount)]
+            sourceCVs.append(distances.index(min(distances)))
+
+    # Assemble the full weight matrix and write it in one call, starting from the bind weights
+    savedStride = len(savedInfluences)
+    weights, stride = skinFn.getWeights(shapePath, components)
+    for cv, source in enumerate(sourceCVs):
+        row = [(index, savedWeights[source * savedStride + savedIndex]) for savedIndex, index in kept]
+        total = sum(w for index, w in row)
+
+        # Renormalise what is left, a CV only weighted to dropped joints keeps its bind weights
+        if total <= 0:
+            continue
+        for index in range(stride):
+            weights[cv * stride + index] = 0.0
+        for index, w in row:
+            weights[cv * stride + index] = w / total
+
+    skinFn.setWeights(shapePath, components, om.MIntArray(list(range(stride))), weights, False)
+    print(f"Loaded skin weights from {path}")
+
+def scaleCurveShapes(shapes, scaleFactor):
+    # Scale every CV about the object-space origin in one write per shape
+    for shape in shapes:
+        curveFn = om.MFnNurbsCurve(getDagPath(shape))
+        cvs = curveFn.cvPositions(om.MSpace.kObject)
+        curveFn.setCVPositions(om.MPointArray([om.MPoint(p.x * scaleFactor, p.y * scaleFactor, p.z * scaleFactor) for p in cvs]), om.MSpace.kObject)
+        curveFn.updateCurve()
+
+# Shape display attributes carried over from the master control
+CURVE_DISPLAY_ATTRS = ["lineWidth", "alwaysDrawOnTop", "overrideEnabled", "overrideDisplayType", "overrideShading",
+                       "overrideColor", "overrideRGBColors", "overrideColorRGB"]
+
+def instanceCurveControls(masterCtrl, names, positions):
+    # Read the master's curve data once, with its world scale baked in like a frozen duplicate
+    shapes = cmds.listRelatives(masterCtrl, shapes=True, type="nurbsCurve", fullPath=True) or []
+    shapeData = []
+    for shape in shapes:
+        shapePath = getDagPath(shape)
+        worldMatrix = om.MTransformationMatrix(shapePath.inclusiveMatrix())
+        scaleMatrix = om.MTransformationMatrix()
+        scaleMatrix.setScale(worldMatrix.scale(om.MSpace.kWorld), om.MSpace.kWorld)
+        scaleMatrix.setShear(worldMatrix.shear(om.MSpace.kWorld), om.MSpace.kWorld)
+        scaleMatrix = scaleMatrix.asMatrix()
+
+        curveFn = om.MFnNurbsCurve(shapePath)
+        cvs = [cv * scaleMatrix for cv in curveFn.cvPositions(om.MSpace.kObject)]
+
+        # Only display attributes changed from their defaults need copying
+        display = {}
+        for attr in CURVE_DISPLAY_ATTRS:
+            if not cmds.attributeQuery(attr, node=shape, exists=True):
+                continue
+            value = cmds.getAttr(f"{shape}.{attr}")
+            value = list(value[0]) if isinstance(value, list) else [value]
+            if value != (cmds.attributeQuery(attr, node=shape, listDefault=True) or value):
+                display[attr] = value
+        shapeData.append((cvs, curveFn.knots(), curveFn.degree, curveFn.form, display))
+
+    # The master is consumed, unlock and zero it once so every duplicate starts clean at the origin
+    if cmds.listRelatives(masterCtrl, parent=True):
+        masterCtrl = cmds.parent(masterCtrl, world=True)[0]
+    for attr in ["tx","ty","tz","rx","ry","rz","sx","sy","sz"]:
+        try: cmds.setAttr(f"{masterCtrl}.{attr}", lock=False)
+        except:
+            pass
+    cmds.xform(masterCtrl, ws=True, m=[1,0,0,0, 0,1,0,0, 0,0,1,0, 0,0,0,1])
+
+    # Build every control's curves already offset to their final position
+    controls = []
+    for name, pos in zip(names, positions):
+        # Transform only duplicate keeps the master's custom attributes
+        ctrl = cmds.duplicate(masterCtrl, parentOnly=True, name=name)[0]
+        ctrlPath = getDagPath(ctrl)
+        ctrlName = ctrlPath.partialPathName().split("|")[-1]
+
+        offset = om.MVector(pos)
+        for i, (cvs, knots, degree, form, display) in enumerate(shapeData):
+            points = om.MPointArray([cv + offset for cv in cvs])
+            shapeObj = om.MFnNurbsCurve().create(points, knots, degree, form, False, False, ctrlPath.node())
+            shapeFn = om.MFnDagNode(shapeObj)
+            shapeFn.setName(f"{ctrlName}Shape" if i == 0 else f"{ctrlName}Shape{i}")
+            for attr, value in display.items():
+                cmds.setAttr(f"{shapeFn.fullPathName()}.{attr}", *value)
+
+        # Pivot on the control position, like a frozen duplicate
+        transformFn = om.MFnTransform(ctrlPath)
+        transformFn.setRotatePivot(om.MPoint(pos), om.MSpace.kTransform, False)
+        transformFn.setScalePivot(om.MPoint(pos), om.MSpace.kTransform, False)
+        controls.append(ctrl)
+
+    return controls
+
 def importRibbonControl(controlCount):
 
-    projectRoot = cmds.workspace(q=True, rd=True).replace("\\", "/")
-    ribbonPath = projectRoot + "Characters/_Creatures/CreatureTest/ctrl/Ctrl_Ribbon.ma"
+    ribbonPath = getRibbonTemplatePath("Ctrl_Ribbon.ma")
 
     # Check if file exists
     if not os.path.exists(ribbonPath):
@@ -290,8 +530,7 @@ def importRibbonControl(controlCount):
     scaleFactor = desiredRadius / ribbonRadius
 
     # Scale CVs of the imported control
-    for s in shapes:
-        cmds.scale(scaleFactor, scaleFactor, scaleFactor, s + ".cv[*]", r=True, os=True)
+    scaleCurveShapes(shapes, scaleFactor)
 
 def duplicateRibbonControls(controlCount):
     # Find the imported master control
@@ -307,25 +546,13 @@ def duplicateRibbonControls(controlCount):
     if not ribbonJoints:
         cmds.error("No c_Ribbon_Jt_* joints found.")
     
-    numControls = len(ribbonJoints)
-    createdControls = []
-
-    for i in range(numControls):
-        # First duplicate without naming
-        dup = cmds.duplicate(masterCtrl, rc=True)[0]
-
-        # Now rename it explicitly to Ribbon_Ctrl_#
-        cleanName = f"Ribbon_Ctrl_{i+1}"
-        dup = cmds.rename(dup, cleanName)
+    # Move the master out of the way of the Ribbon_Ctrl_# names
+    masterCtrl = cmds.rename(masterCtrl, "Ribbon_Ctrl_Master")
 
-        # Position based on corresponding ribbon joint
-        pos = cmds.xform(ribbonJoints[i], q=True, ws=True, t=True)
-        cmds.xform(dup, ws=True, t=pos)
-
-        cmds.setAttr(dup + ".rotate", 0, 0, 0, type="double3")
-        cmds.makeIdentity(dup, apply=True, translate=True, rotate=True, scale=True)
-
-        createdControls.append(dup)
+    # Position based on corresponding ribbon joint
+    names = [f"Ribbon_Ctrl_{i+1}" for i in range(len(ribbonJoints))]
+    positions = [cmds.xform(j, q=True, ws=True, t=True) for j in ribbonJoints]
+    createdControls = instanceCurveControls(masterCtrl, names, positions)
 
     # Remove master control
     if cmds.objExists(masterCtrl):
@@ -362,8 +589,7 @@ def parentRibbonJoints():
 
 def importRibbonPlacement():
     # Build file path
-    projectRoot = cmds.workspace(q=True, rd=True).replace("\\", "/")
-    placementPath = projectRoot + "Characters/_Creatures/CreatureTest/ctrl/Ctrl_Ribbon_Placement.ma"
+    placementPath = getRibbonTemplatePath("Ctrl_Ribbon_Placement.ma")
 
     # Validate file
     if not os.path.exists(placementPath):
@@ -384,20 +610,7 @@ def importRibbonPlacement():
     placementCtrl = cmds.rename(placementCtrl, "Ctrl_Ribbon_Placement")
 
     # Find body ctrl
-    controls = ["tsm3_upper_body", "spine_C0_ik0_ctrl", "body_C0_ctrl", "world_ctrl"]
-    worldCtrl = None
-    for name in controls:
-        if cmds.objExists(name):
-            worldCtrl = name
-            break
-    if not worldCtrl:
-        worldCtrls = cmds.ls(type="transform") or []
-        priority_contains = ["tsm3_upper_body", "spine_c0_ik0_ctrl", "body_c0_ctrl", "world_ctrl"]
-        for needle in priority_contains:
-            matches = [w for w in worldCtrls if needle in w.lower()]
-            if matches:
-                worldCtrl = sorted(matches, key=len)[0]  # prefer cleanest/shortest (good for namespaces)
-                break
+    worldCtrl = findBodyCtrl()
     if not worldCtrl:
         cmds.error("No body ctrl found")
 
@@ -428,8 +641,7 @@ def importRibbonPlacement():
     scaleFactor = desiredRadius / placementRadius
 
     # Scale CVs directly
-    for s in placementShapes:
-        cmds.scale(scaleFactor, scaleFactor, scaleFactor, s + ".cv[*]", r=True, os=True)
+    scaleCurveShapes(placementShapes, scaleFactor)
 
     # Freeze transforms
     cmds.makeIdentity(placementCtrl, apply=True, translate=True, rotate=True, scale=True)
@@ -478,13 +690,13 @@ def createSineTwistPlanes():
     # Create twist deformer
     twistA, twistB = cmds.nonLinear(twist, type="twist", name="RibbonPlane_TwistDef")
     # Determine which returned node is the handle (transform)
-    twistHandle = twistA if cmds.nodeType(twistA) == "transform" else twistB
+    twistHandle = twistA if queryNodeTypes([twistA])[0] == "transform" else twistB
     cmds.setAttr(twistHandle + ".rotateX", -90)
 
     # Create sine deformer
     sineA, sineB = cmds.nonLinear(sine, type="sine", name="RibbonPlane_SineDef")
     # Determine handle by checking node type
-    sineHandle = sineA if cmds.nodeType(sineA) == "transform" else sineB
+    sineHandle = sineA if queryNodeTypes([sineA])[0] == "transform" else sineB
     cmds.setAttr(sineHandle + ".rotateX", 90)
     cmds.xform(sineHandle, r=True, t=[0, 0, 140])
 
@@ -496,7 +708,8 @@ def createSineTwistPlanes():
 
     # Get all deformers on the geometry
     history = cmds.listHistory(plane) or []
-    deformers = [d for d in history if cmds.nodeType(d) in ("blendShape","twist","sine","bend","flare","squash","lattice","cluster")]
+    historyTypes = queryNodeTypes(history)
+    deformers = [d for d, t in zip(history, historyTypes) if t in ("blendShape","twist","sine","bend","flare","squash","lattice","cluster")]
     for d in deformers:
         if d != skin:
             try:
@@ -508,8 +721,7 @@ def createSineTwistPlanes():
 
 def importCtrlX():
     # Build file path
-    projectRoot = cmds.workspace(q=True, rd=True).replace("\\", "/")
-    ctrlXPath = projectRoot + "Characters/_Creatures/CreatureTest/ctrl/Ctrl_X.ma"
+    ctrlXPath = getRibbonTemplatePath("Ctrl_X.ma")
     if not os.path.exists(ctrlXPath):
         cmds.error("Ctrl_X.ma not found at:\n" + ctrlXPath)
     cmds.file(ctrlXPath, i=True, type="mayaAscii", ignoreVersion=True, mergeNamespacesOnClash=True)
@@ -559,7 +771,113 @@ def importCtrlX():
 
     return imported
 
-def createRibbonSDKs():
+# SDK mapping (from your screenshot)
+# driverAttr, driverStart, driverEnd, drivenTarget, drivenAttr, drivenStart, drivenEnd
+SINE_INPUT_MAP = [
+    ("Amplitude", 0, 7, "deformer", "amplitude", 0, 2),
+    ("Frequency", 0, 4, "deformer", "wavelength", 4.5, 0.5),
+    ("Animation", 0, 2000, "deformer", "offset", 0, 2000),
+    ("HeadLock", 0, 3, "deformer", "dropoff", -1, -0.7),
+    ("TailWave", 0, 7, "deformer", "lowBound", -10, -2),
+    ("CurveDirection", 0, 1, "handle", "rotateZ", 0, 90),
+]
+TWIST_INPUT_MAP = [
+    ("StartTwist", 0, 2000, "deformer", "startAngle", 0, 2000),
+    ("EndTwist",   0, 2000, "deformer", "endAngle",   0, 2000),
+]
+
+def createLinearSDK(driver, dStart, dEnd, driven, vStart, vEnd):
+    # Start key
+    cmds.setAttr(driver, dStart)
+    cmds.setAttr(driven, vStart)
+    cmds.setDrivenKeyframe(driven, cd=driver)
+
+    # End key
+    cmds.setAttr(driver, dEnd)
+    cmds.setAttr(driven, vEnd)
+    cmds.setDrivenKeyframe(driven, cd=driver)
+
+    # Linear tangents
+    curves = cmds.keyframe(driven, q=True, name=True) or []
+    for c in curves:
+        cmds.keyTangent(c, itt="linear", ott="linear")
+
+def isDriverLimited(driver, dStart, dEnd):
+    # True when the driver attribute cannot leave the key range, so clamping is already done
+    node, attr = driver.split(".", 1)
+    if not cmds.attributeQuery(attr, node=node, minExists=True) or not cmds.attributeQuery(attr, node=node, maxExists=True):
+        return False
+    low = cmds.attributeQuery(attr, node=node, minimum=True)[0]
+    high = cmds.attributeQuery(attr, node=node, maximum=True)[0]
+    return low >= min(dStart, dEnd) and high <= max(dStart, dEnd)
+
+def connectLinearMappings(mappings, name):
+    # (driver, dStart, dEnd, driven, vStart, vEnd) plugs, identity mappings on a limited driver connect straight through
+    packed = []
+    for driver, dStart, dEnd, driven, vStart, vEnd in mappings:
+        if (dStart, dEnd) == (vStart, vEnd) and isDriverLimited(driver, dStart, dEnd):
+            cmds.connectAttr(driver, driven, force=True)
+        else:
+            packed.append((driver, dStart, dEnd, driven, vStart, vEnd))
+
+    # The rest share setRange nodes three at a time, which clamp like the SDK curve's constant infinity
+    nodes = []
+    for i in range(0, len(packed), 3):
+        node = cmds.createNode("setRange", name=f"{name}_setRange")
+        for axis, (driver, dStart, dEnd, driven, vStart, vEnd) in zip("XYZ", packed[i:i + 3]):
+            cmds.setAttr(f"{node}.oldMin{axis}", dStart)
+            cmds.setAttr(f"{node}.oldMax{axis}", dEnd)
+            cmds.setAttr(f"{node}.min{axis}", vStart)
+            cmds.setAttr(f"{node}.max{axis}", vEnd)
+            cmds.connectAttr(driver, f"{node}.value{axis}")
+            cmds.connectAttr(f"{node}.outValue{axis}", driven, force=True)
+        nodes.append(node)
+    return nodes
+
+def createLinearRemap(driver, dStart, dEnd, vStart, vEnd, name):
+    # remapValue clamps outside the input range like the SDK curve's constant infinity
+    remap = cmds.createNode("remapValue", name=name)
+    cmds.setAttr(remap + ".inputMin", dStart)
+    cmds.setAttr(remap + ".inputMax", dEnd)
+    cmds.setAttr(remap + ".outputMin", vStart)
+    cmds.setAttr(remap + ".outputMax", vEnd)
+
+    # Straight linear ramp from 0 to 1
+    for i in (0, 1):
+        cmds.setAttr(f"{remap}.value[{i}].value_Position", i)
+        cmds.setAttr(f"{remap}.value[{i}].value_FloatValue", i)
+        cmds.setAttr(f"{remap}.value[{i}].value_Interp", 1)
+
+    cmds.connectAttr(driver, remap + ".inputValue")
+    return remap
+
+def applyInputMappings(ctrl, driverAttrs, sdkMap, useRemapNodes=False):
+    if useRemapNodes:
+        connectLinearMappings([(f"{ctrl}.{driverAttr}", dStart, dEnd, f"{drivenNode}.{drivenAttr}", vStart, vEnd)
+                               for driverAttr, dStart, dEnd, drivenNode, drivenAttr, vStart, vEnd in sdkMap], ctrl)
+        return
+
+    # Save all original values
+    originalValues = {}
+    for driverAttr, dStart, dEnd, drivenNode, drivenAttr, vStart, vEnd in sdkMap:
+        plug = f"{drivenNode}.{drivenAttr}"
+        originalValues[plug] = cmds.getAttr(plug)
+
+    driverOriginals = {a: cmds.getAttr(f"{ctrl}.{a}") for a in driverAttrs}
+
+    # Apply SDKs
+    for driverAttr, dStart, dEnd, drivenNode, drivenAttr, vStart, vEnd in sdkMap:
+        createLinearSDK(f"{ctrl}.{driverAttr}", dStart, dEnd, f"{drivenNode}.{drivenAttr}", vStart, vEnd)
+
+    # Restore original driven values
+    for plug, value in originalValues.items():
+        cmds.setAttr(plug, value)
+
+    # Restore driver values
+    for attr, value in driverOriginals.items():
+        cmds.setAttr(f"{ctrl}.{attr}", value)
+
+def createRibbonSDKs(useRemapNodes=False):
 
     waveCtrl  = "Attribute_Wave_Ctrl"
     twistCtrl = "Attribute_Twist_Ctrl"
@@ -586,6 +904,12 @@ def createRibbonSDKs():
         if not cmds.attributeQuery("OFF_ON", node=ctrl, exists=True):
             cmds.addAttr(ctrl, ln="OFF_ON", at="float", min=0, max=1, dv=0, k=True)
 
+    # Drive the blendshape weights straight from OFF_ON
+    if useRemapNodes:
+        connectLinearMappings([(f"{waveCtrl}.OFF_ON", 0, 1, sineAttr, 0, 1),
+                               (f"{twistCtrl}.OFF_ON", 0, 1, twistAttr, 0, 1)], bsNode)
+        return
+
     # Wave control blenshape
     # OFF
     cmds.setAttr(f"{waveCtrl}.OFF_ON", 0)
@@ -614,7 +938,7 @@ def createRibbonSDKs():
         for c in curves:
             cmds.keyTangent(c, itt="linear", ott="linear")
 
-def createSineInputSDKs():
+def createSineInputSDKs(useRemapNodes=False):
     waveCtrl = "Attribute_Wave_Ctrl"
     sineHandle = "RibbonPlane_SineDefHandle"
 
@@ -629,60 +953,19 @@ def createSineInputSDKs():
     sineDef = connections[0]
 
     # Ensure driver attrs exist
-    driverAttrs = ["Amplitude", "Frequency", "Animation", "HeadLock", "TailWave", "CurveDirection"]
-    for a in driverAttrs:
+    # Limited to the key range, so identity mappings can skip the clamp node
+    driverAttrs = [m[0] for m in SINE_INPUT_MAP]
+    for a, dStart, dEnd in [m[:3] for m in SINE_INPUT_MAP]:
         if not cmds.attributeQuery(a, node=waveCtrl, exists=True):
-            cmds.addAttr(waveCtrl, ln=a, at="float", dv=0, k=True)
-
-    # SDK mapping (from your screenshot)
-    sdkMap = [
-        # driverAttr, driverStart, driverEnd,  drivenAttr,  drivenStart, drivenEnd
-        ("Amplitude", 0, 7, sineDef, "amplitude", 0, 2),
-        ("Frequency", 0, 4, sineDef, "wavelength", 4.5, 0.5),
-        ("Animation", 0, 2000, sineDef, "offset", 0, 2000),
-        ("HeadLock", 0, 3, sineDef, "dropoff", -1, -0.7),
-        ("TailWave", 0, 7, sineDef, "lowBound", -10, -2),
-        ("CurveDirection", 0, 1, sineHandle, "rotateZ", 0, 90),
-    ]
-
-    # Save all original values
-    originalValues = {}
-    for driverAttr, dStart, dEnd, drivenNode, drivenAttr, vStart, vEnd in sdkMap:
-        plug = f"{drivenNode}.{drivenAttr}"
-        originalValues[plug] = cmds.getAttr(plug)
-
-    driverOriginals = {a: cmds.getAttr(f"{waveCtrl}.{a}") for a in driverAttrs}
-
-    # Apply SDKs
-    for driverAttr, dStart, dEnd, drivenNode, drivenAttr, vStart, vEnd in sdkMap:
-
-        fullDriver = f"{waveCtrl}.{driverAttr}"
-        fullDriven = f"{drivenNode}.{drivenAttr}"
+            cmds.addAttr(waveCtrl, ln=a, at="float", min=dStart, max=dEnd, dv=0, k=True)
 
-        # Start key
-        cmds.setAttr(fullDriver, dStart)
-        cmds.setAttr(fullDriven, vStart)
-        cmds.setDrivenKeyframe(fullDriven, cd=fullDriver)
+    # Resolve the mapping targets to the deformer and its handle
+    targets = {"deformer": sineDef, "handle": sineHandle}
+    sdkMap = [(a, dS, dE, targets[t], attr, vS, vE) for a, dS, dE, t, attr, vS, vE in SINE_INPUT_MAP]
 
-        # End key
-        cmds.setAttr(fullDriver, dEnd)
-        cmds.setAttr(fullDriven, vEnd)
-        cmds.setDrivenKeyframe(fullDriven, cd=fullDriver)
+    applyInputMappings(waveCtrl, driverAttrs, sdkMap, useRemapNodes)
 
-        # Linear tangents
-        curves = cmds.keyframe(fullDriven, q=True, name=True) or []
-        for c in curves:
-            cmds.keyTangent(c, itt="linear", ott="linear")
-
-    # Restore original driven values
-    for plug, value in originalValues.items():
-        cmds.setAttr(plug, value)
-
-    # Restore driver values
-    for attr, value in driverOriginals.items():
-        cmds.setAttr(f"{waveCtrl}.{attr}", value)
-
-def createTwistInputSDKs():
+def createTwistInputSDKs(useRemapNodes=False):
     twistCtrl = "Attribute_Twist_Ctrl"
     twistHandle = "RibbonPlane_TwistDefHandle"
 
@@ -697,54 +980,15 @@ def createTwistInputSDKs():
     twistDef = connections[0]  # this is your twist1 node
 
     # Ensure driver attributes exist on Attribute_Twist_Ctrl
-    driverAttrs = ["StartTwist", "EndTwist"]
-    for a in driverAttrs:
+    driverAttrs = [m[0] for m in TWIST_INPUT_MAP]
+    for a, dStart, dEnd in [m[:3] for m in TWIST_INPUT_MAP]:
         if not cmds.attributeQuery(a, node=twistCtrl, exists=True):
-            cmds.addAttr(twistCtrl, ln=a, at="float", dv=0, k=True)
-
-    # SDK mapping derived from your screenshot table
-    sdkMap = [
-        # driverAttr, driverStart, driverEnd, drivenNode, drivenAttr, drivenStart, drivenEnd
-        ("StartTwist", 0, 2000, twistDef, "startAngle", 0, 2000),
-        ("EndTwist",   0, 2000, twistDef, "endAngle",   0, 2000),
-    ]
-
-    # Store original values for restoration
-    originalValues = {}
-    for driverAttr, dStart, dEnd, drivenNode, drivenAttr, vStart, vEnd in sdkMap:
-        plug = f"{drivenNode}.{drivenAttr}"
-        originalValues[plug] = cmds.getAttr(plug)
-
-    driverOriginals = {a: cmds.getAttr(f"{twistCtrl}.{a}") for a in driverAttrs}
-
-    # Create the SDKs
-    for driverAttr, dStart, dEnd, drivenNode, drivenAttr, vStart, vEnd in sdkMap:
-
-        fullDriver = f"{twistCtrl}.{driverAttr}"
-        fullDriven = f"{drivenNode}.{drivenAttr}"
+            cmds.addAttr(twistCtrl, ln=a, at="float", min=dStart, max=dEnd, dv=0, k=True)
 
-        # Start key
-        cmds.setAttr(fullDriver, dStart)
-        cmds.setAttr(fullDriven, vStart)
-        cmds.setDrivenKeyframe(fullDriven, cd=fullDriver)
+    targets = {"deformer": twistDef}
+    sdkMap = [(a, dS, dE, targets[t], attr, vS, vE) for a, dS, dE, t, attr, vS, vE in TWIST_INPUT_MAP]
 
-        # End key
-        cmds.setAttr(fullDriver, dEnd)
-        cmds.setAttr(fullDriven, vEnd)
-        cmds.setDrivenKeyframe(fullDriven, cd=fullDriver)
-
-        # Make the curve linear
-        curves = cmds.keyframe(fullDriven, q=True, name=True) or []
-        for c in curves:
-            cmds.keyTangent(c, itt="linear", ott="linear")
-
-    # Restore driven values
-    for plug, value in originalValues.items():
-        cmds.setAttr(plug, value)
-
-    # Restore driver values
-    for attr, value in driverOriginals.items():
-        cmds.setAttr(f"{twistCtrl}.{attr}", value)
+    applyInputMappings(twistCtrl, driverAttrs, sdkMap, useRemapNodes)
 
 def cleanupRibbonRig():
     
@@ -817,17 +1061,9 @@ def cleanupRibbonRig():
         except:
             pass
 
-    bodyCtrl = cmds.ls(type="transform") or []
-    worldCandidates = [w for w in bodyCtrl if "tsm3_upper_body" in w.lower()]
-    if not worldCandidates:
-        worldCandidates = [w for w in bodyCtrl if "spine_c0_ik0_ctrl" in w.lower()]
-        if not worldCandidates:
-            worldCandidates = [w for w in bodyCtrl if "body_c0_ctrl" in w.lower()]
-            if not worldCandidates:
-                worldCandidates = [w for w in bodyCtrl if "world_ctrl" in w.lower()]
-                if not worldCandidates:
-                    cmds.error("No body ctrl found")
-    bodyCtrl = worldCandidates[0]
+    bodyCtrl = findBodyCtrl()
+    if not bodyCtrl:
+        cmds.error("No body ctrl found")
   
     # Create local/world space switch on the placement control along with parent constraint
     addPlacementSpaceSwitch(placement=placement, localTarget=bodyCtrl)
@@ -893,23 +1129,599 @@ def addPlacementSpaceSwitch(placement="Ctrl_Ribbon_Placement", localTarget=None)
 
     return pcon, ocon, scon
 
+def getRibbonFKControls(rigGroup="RibbonRig"):
+    if not cmds.objExists(rigGroup):
+        cmds.error(f"{rigGroup} does not exist.")
+
+    # Follicle joints live under the follicles inside the rig group
+    follicleJoints = cmds.listRelatives(rigGroup, allDescendents=True, type="joint") or []
+    follicleJoints = [j for j in follicleJoints if "c_Follicle_Jt_" in j]
+    follicleJoints = sorted(follicleJoints, key=lambda x: int(x.split("_")[-1]))
+
+    # Each follicle joint drives one FK control through a parentConstraint parented under it
+    pairs = []
+    for jnt in follicleJoints:
+        constraints = cmds.listConnections(jnt, type="parentConstraint", source=False, destination=True) or []
+        for con in sorted(set(constraints)):
+            fk = cmds.listRelatives(con, parent=True)
+            if fk:
+                pairs.append((fk[0], con))
+
+    return pairs
+
+# Driver utilities left behind once the ribbon they fed is deleted
+RIBBON_UTILITY_NODE_TYPES = ["remapValue", "setRange", "multDoubleLinear", "addDoubleLinear", "unitConversion", "animCurveUU"]
+
+def bakeRibbonToFK(startFrame=None, endFrame=None, rigGroup="RibbonRig", deleteRibbon=True):
+    pairs = getRibbonFKControls(rigGroup)
+    if not pairs:
+        cmds.error(f"No FK controls constrained to {rigGroup} found.")
+
+    if startFrame is None:
+        startFrame = cmds.playbackOptions(q=True, min=True)
+    if endFrame is None:
+        endFrame = cmds.playbackOptions(q=True, max=True)
+    frames = list(range(int(startFrame), int(endFrame) + 1))
+
+    # Only bake the channels the constraints actually drive, keyed controls take them through a pairBlend
+    fkControls = []
+    channels = {}
+    pairBlends = set()
+    for fk, con in pairs:
+        if fk in channels:
+            continue
+        driven = []
+        for attr in ["translateX","translateY","translateZ","rotateX","rotateY","rotateZ"]:
+            plug = f"{fk}.{attr}"
+            if cmds.listConnections(plug, source=True, destination=False, skipConversionNodes=True, type="parentConstraint"):
+                driven.append(attr)
+                continue
+            for blend in cmds.listConnections(plug, source=True, destination=False, skipConversionNodes=True, type="pairBlend") or []:
+                if cmds.listConnections(blend, source=True, destination=False, skipConversionNodes=True, type="parentConstraint"):
+                    driven.append(attr)
+                    pairBlends.add(blend)
+        if driven:
+            fkControls.append(fk)
+            channels[fk] = driven
+
+    skipped = sorted(set(fk for fk, con in pairs) - set(channels))
+    if skipped:
+        cmds.warning(f"No constrained channels found on {', '.join(skipped)}, left constrained to {rigGroup}.")
+
+    # Sample every control once per frame, straight from the evaluated transforms, in the scene's units
+    transformFns = [om.MFnTransform(getDagPath(fk)) for fk in fkControls]
+    samples = {fk: {attr: [] for attr in channels[fk]} for fk in fkControls}
+    uiUnit = om.MTime.uiUnit()
+    linearScale = om.MDistance(1.0).asUnits(om.MDistance.uiUnit())
+    angleScale = om.MAngle(1.0).asUnits(om.MAngle.uiUnit())
+    originalTime = cmds.currentTime(q=True)
+
+    cmds.refresh(suspend=True)
+    try:
+        for frame in frames:
+            oma.MAnimControl.setCurrentTime(om.MTime(frame, uiUnit))
+            for fk, fn in zip(fkControls, transformFns):
+                t = fn.translation(om.MSpace.kTransform)
+                r = fn.rotation()
+                values = {"translateX": t.x * linearScale, "translateY": t.y * linearScale, "translateZ": t.z * linearScale,
+                          "rotateX": r.x * angleScale, "rotateY": r.y * angleScale, "rotateZ": r.z * angleScale}
+                for attr in channels[fk]:
+                    samples[fk][attr].append(values[attr])
+    finally:
+        cmds.currentTime(originalTime)
+        cmds.refresh(suspend=False)
+
+    # Every scene edit goes through cmds in one chunk, so a single undo restores the rig
+    cmds.undoInfo(openChunk=True, chunkName="bakeRibbonToFK")
+    try:
+        # Remove the baked controls' constraints, and the pairBlends with the keys they replace
+        blendNodes = list(pairBlends)
+        if blendNodes:
+            blendNodes += cmds.listConnections(blendNodes, source=True, destination=False, type="animCurve") or []
+        cmds.delete(list(set(con for fk, con in pairs if fk in channels)))
+        blendNodes = [n for n in blendNodes if cmds.objExists(n)]
+        if blendNodes:
+            cmds.delete(blendNodes)
+
+        # Write each channel as one animCurve, all keys in a single setAttr so the undo queue holds it
+        curves = []
+        rotationCurves = []
+        for fk in fkControls:
+            cmds.cutKey(fk, attribute=channels[fk], clear=True)
+            for attr in channels[fk]:
+                curveType = "animCurveTA" if attr.startswith("rotate") else "animCurveTL"
+                curve = cmds.createNode(curveType, name=f"{fk}_{attr}")
+                keys = [v for key in zip(frames, samples[fk][attr]) for v in key]
+                cmds.setAttr(f"{curve}.ktv[0:{len(frames) - 1}]", *keys)
+                cmds.connectAttr(curve + ".output", f"{fk}.{attr}", force=True)
+                curves.append(curve)
+                if attr.startswith("rotate"):
+                    rotationCurves.append(curve)
+
+        # Same tangents setKeyframe would give, and rotations kept continuous across the baked range
+        cmds.keyTangent(curves, inTangentType=cmds.keyTangent(q=True, g=True, inTangentType=True)[0],
+                        outTangentType=cmds.keyTangent(q=True, g=True, outTangentType=True)[0])
+        if rotationCurves:
+            cmds.filterCurve(rotationCurves)
+
+        # Strip the ribbon now that the FK controls carry the motion
+        if deleteRibbon and cmds.objExists(rigGroup):
+            # Driver utilities live outside the group, so collect them before it goes
+            utilityNodes = [node for node, nodeType in ribbonAudit.getRibbonRigNodes(rigGroup).items()
+                            if nodeType in RIBBON_UTILITY_NODE_TYPES]
+            cmds.delete(rigGroup)
+
+            # Anything still driving another ribbon (e.g. a shared hub remap) is kept
+            orphans = [node for node in utilityNodes if cmds.objExists(node)
+                       and not cmds.listConnections(node, source=False, destination=True)]
+            if orphans:
+                cmds.delete(orphans)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+    print(f"Baked {len(fkControls)} FK controls over {len(frames)} frames")
+    return fkControls
+
+def getControlCenters(controls):
+    # Shape centers, as createPlane and createRibbonControlJoints measure them
+    return [[(b[0] + b[3]) * 0.5,(b[1] + b[4]) * 0.5,(b[2] + b[5]) * 0.5] for b in queryCurveBoundingBoxes(controls)]
+
+def reflectPoint(point, axis):
+    reflected = list(point)
+    reflected[axis] = -reflected[axis]
+    return reflected
+
+def negateDrivenPlug(plug):
+    # Flip whatever drives the plug, each SDK curve, remap or setRange channel feeds a single plug
+    sources = cmds.listConnections(plug, source=True, destination=False, plugs=True) or []
+    if not sources:
+        return
+    node, attr = sources[0].split(".", 1)
+    nodeType = cmds.nodeType(node)
+    if nodeType == "unitConversion":
+        # Angles driven straight from a control pass through one
+        cmds.setAttr(node + ".conversionFactor", -cmds.getAttr(node + ".conversionFactor"))
+    elif nodeType.startswith("animCurve"):
+        cmds.scaleKey(node, valueScale=-1, valuePivot=0)
+    elif nodeType == "remapValue":
+        for a in ("outputMin", "outputMax"):
+            cmds.setAttr(f"{node}.{a}", -cmds.getAttr(f"{node}.{a}"))
+    elif nodeType == "setRange":
+        for a in ("min", "max"):
+            cmds.setAttr(f"{node}.{a}{attr[-1]}", -cmds.getAttr(f"{node}.{a}{attr[-1]}"))
+    else:
+        mult = cmds.createNode("multDoubleLinear", name=plug.replace(".", "_") + "_mirror_mult")
+        cmds.setAttr(mult + ".input2", -1)
+        cmds.connectAttr(sources[0], mult + ".input1")
+        cmds.connectAttr(mult + ".output", plug, force=True)
+
+# Temporary tag linking duplicated DG nodes back to their source while mirroring
+RIBBON_MIRROR_SOURCE_ATTR = "ribbonMirrorSource"
+
+def mirrorRibbonRig(targetControls, prefix="R_", rigGroup="RibbonRig", mirrorBehavior=True, mirrorAxis="x", tolerance=0.05):
+    if not cmds.objExists(rigGroup):
+        cmds.error(f"{rigGroup} does not exist.")
+
+    # Source FK controls base to tip, target given tip to base like countFKControls
+    sourceControls = [fk for fk, con in getRibbonFKControls(rigGroup)]
+    targetFK = targetControls[::-1]
+    if len(sourceControls) != len(targetFK):
+        cmds.error("Mismatch: Target chain does not have the same number of controls as the ribbon!")
+
+    # The target chain must be the reflection of the source across the world mirror plane
+    axis = "xyz".index(mirrorAxis.lower())
+    sourceCenters = getControlCenters(sourceControls)
+    targetCenters = getControlCenters(targetFK)
+    chainLength = sum(sum((b[i] - a[i]) ** 2 for i in range(3)) ** 0.5 for a, b in zip(sourceCenters, sourceCenters[1:]))
+    for fk, source, target in zip(targetFK, sourceCenters, targetCenters):
+        reflected = reflectPoint(source, axis)
+        offset = sum((reflected[i] - target[i]) ** 2 for i in range(3)) ** 0.5
+        if offset > tolerance * chainLength:
+            cmds.error(f"'{fk}' is not the {mirrorAxis.upper()} mirror of its source control ({offset:.3f} units off).")
+
+    # Nodes that make up the rig, its DAG plus the DG history between them
+    descendants = cmds.listRelatives(rigGroup, allDescendents=True, fullPath=True) or []
+    internal = set(cmds.ls([rigGroup] + descendants, long=True))
+    internal.update(cmds.ls(cmds.listHistory(descendants, pruneDagObjects=True) or [], long=True))
+
+    # Break inputs coming from outside the rig (space switch targets) so they are not duplicated
+    connections = cmds.listConnections(list(internal), source=True, destination=False, connections=True, plugs=True) or []
+    external = []
+    for dst, src in zip(connections[0::2], connections[1::2]):
+        srcNode = cmds.ls(src.split(".")[0], long=True)[0]
+        if srcNode not in internal:
+            external.append((src, dst))
+
+    # Tag the DG nodes taking those inputs, the tag survives the duplicate and names the source node
+    rootPath = cmds.ls(rigGroup, long=True)[0]
+    dgTargets = sorted(set(dst.split(".")[0] for src, dst in external
+                           if not cmds.ls(dst.split(".")[0], long=True)[0].startswith(rootPath + "|")))
+    for node in dgTargets:
+        cmds.addAttr(node, ln=RIBBON_MIRROR_SOURCE_ATTR, dt="string")
+        cmds.setAttr(f"{node}.{RIBBON_MIRROR_SOURCE_ATTR}", node, type="string")
+
+    for src, dst in external:
+        cmds.disconnectAttr(src, dst)
+    try:
+        duplicated = cmds.duplicate(rigGroup, upstreamNodes=True)
+    finally:
+        for src, dst in external:
+            cmds.connectAttr(src, dst, force=True)
+        for node in dgTargets:
+            cmds.deleteAttr(f"{node}.{RIBBON_MIRROR_SOURCE_ATTR}")
+    dupRoot = cmds.ls(duplicated[0], long=True)[0]
+    dupUuids = cmds.ls(duplicated[1:], uuid=True)
+
+    # Rename duplicated DAG nodes deepest first so parent paths stay valid
+    dupDescendants = cmds.listRelatives(dupRoot, allDescendents=True, fullPath=True) or []
+    dagNames = set(n.split("|")[-1] for n in dupDescendants + [dupRoot])
+    for node in sorted(dupDescendants, key=lambda n: -n.count("|")):
+        cmds.rename(node, prefix + node.split("|")[-1])
+    dupRoot = cmds.rename(dupRoot, prefix + rigGroup)
+
+    # Rename duplicated DG nodes, dropping the number Maya appended on the clash
+    for node in duplicated[1:]:
+        if node.split("|")[-1] in dagNames or not cmds.objExists(node):
+            continue
+        cmds.rename(node, prefix + re.sub(r"\d+$", "", node))
+
+    # Duplicated DG nodes by the source node they were copied from
+    dupDG = {}
+    for node in cmds.ls(dupUuids):
+        if cmds.attributeQuery(RIBBON_MIRROR_SOURCE_ATTR, node=node, exists=True):
+            dupDG[cmds.getAttr(f"{node}.{RIBBON_MIRROR_SOURCE_ATTR}")] = node
+            cmds.deleteAttr(f"{node}.{RIBBON_MIRROR_SOURCE_ATTR}")
+
+    # Hook the duplicate up to the same outside inputs
+    unmapped = []
+    for src, dst in external:
+        dstNode, dstAttr = dst.split(".", 1)
+        dstPath = cmds.ls(dstNode, long=True)[0]
+        if dstPath.startswith(rootPath + "|"):
+            relative = dstPath[len(rootPath):].split("|")[1:]
+            dupPlug = "|" + dupRoot + "".join("|" + prefix + n for n in relative) + "." + dstAttr
+        elif dstNode in dupDG:
+            dupPlug = f"{dupDG[dstNode]}.{dstAttr}"
+        else:
+            unmapped.append(dst)
+            continue
+        cmds.connectAttr(src, dupPlug, force=True)
+    if unmapped:
+        cmds.warning(f"Could not rewire these inputs onto the {prefix} ribbon: {', '.join(unmapped)}")
+
+    # Reflect every ribbon control onto the target side, the joints ride along and the plane follows the skin
+    dupTransforms = cmds.listRelatives(dupRoot, allDescendents=True, type="transform", fullPath=True) or []
+    for node in dupTransforms:
+        shortName = node.split("|")[-1]
+        if not cmds.listRelatives(node, shapes=True, type="nurbsCurve"):
+            continue
+        if shortName.startswith(prefix + "Ribbon_Ctrl_"):
+            pos = cmds.xform(node, q=True, ws=True, rp=True)
+            reflected = reflectPoint(pos, axis)
+            cmds.move(reflected[0] - pos[0], reflected[1] - pos[1], reflected[2] - pos[2], node, r=True, ws=True)
+            cmds.makeIdentity(node, apply=True, translate=True)
+        elif shortName.startswith(prefix + "Attribute_"):
+            # Translate channels are locked, move the shape instead
+            shapes = cmds.listRelatives(node, shapes=True, type="nurbsCurve", fullPath=True)
+            bbox = cmds.exactWorldBoundingBox(shapes)
+            center = [(bbox[0] + bbox[3]) * 0.5,(bbox[1] + bbox[4]) * 0.5,(bbox[2] + bbox[5]) * 0.5]
+            reflected = reflectPoint(center, axis)
+            cmds.move(reflected[0] - center[0], reflected[1] - center[1], reflected[2] - center[2], [s + ".cv[*]" for s in shapes], r=True, ws=True)
+
+    # Flip sideways wave and twist so both sides move symmetrically from the same values
+    if mirrorBehavior:
+        mirrored = []
+        for handleName, attrs in [("RibbonPlane_SineDefHandle", ["amplitude"]), ("RibbonPlane_TwistDefHandle", ["startAngle", "endAngle"])]:
+            handle = prefix + handleName
+            if not cmds.objExists(handle):
+                continue
+            deformers = cmds.listConnections(handle, type="nonLinear") or []
+            plugs = [f"{deformers[0]}.{a}" for a in attrs] if deformers else []
+            if handleName == "RibbonPlane_SineDefHandle":
+                plugs.append(handle + ".rotateZ")
+            mirrored += plugs
+        for plug in mirrored:
+            negateDrivenPlug(plug)
+
+    # Drive the target chain from the duplicated follicle joints
+    follicleJoints = cmds.listRelatives(dupRoot, allDescendents=True, type="joint") or []
+    follicleJoints = [j for j in follicleJoints if j.startswith(prefix + "c_Follicle_Jt_")]
+    follicleJoints = sorted(follicleJoints, key=lambda x: int(x.split("_")[-1]))
+    for fk, jnt in zip(targetFK, follicleJoints):
+        cmds.parentConstraint(jnt, fk, mo=True)
+        print(f"Parent constrained {fk} to {jnt}")
 
-def runRibbonRig():
+    print(f"\n{dupRoot} mirrored from {rigGroup}")
+    return dupRoot
+
+def profileRibbonRig(outputPath, startFrame=None, endFrame=None, rigGroup="RibbonRig", bufferSize=100):
+    if startFrame is None:
+        startFrame = cmds.playbackOptions(q=True, min=True)
+    if endFrame is None:
+        endFrame = cmds.playbackOptions(q=True, max=True)
+    frames = list(range(int(startFrame), int(endFrame) + 1))
+
+    # SDK curves belong to the stage of the node they drive
+    nodeTypes = ribbonAudit.getRibbonRigNodes(rigGroup)
+    nodes = {}
+    for node, nodeType in nodeTypes.items():
+        stage = ribbonProfile.classifyRibbonNode(node, nodeType)
+        if nodeType.startswith("animCurve"):
+            driven = cmds.listConnections(node, source=False, destination=True, showType=True) or []
+            for drivenNode, drivenType in zip(driven[0::2], driven[1::2]):
+                stage = ribbonProfile.classifyRibbonNode(drivenNode, drivenType)
+                break
+        nodes[node.split("|")[-1]] = stage
+
+    # Play the range with the evaluation profiler recording
+    originalTime = cmds.currentTime(q=True)
+    cmds.profiler(bufferSize=bufferSize)
+    cmds.profiler(reset=True)
+    cmds.profiler(sampling=True)
+    try:
+        for frame in frames:
+            cmds.currentTime(frame, update=True)
+    finally:
+        cmds.profiler(sampling=False)
+        cmds.currentTime(originalTime)
+
+    # Keep Maya's own profile for the Profiler window next to the capture
+    cmds.profiler(output=os.path.splitext(outputPath)[0] + "_maya.txt")
+
+    events = []
+    for i in range(cmds.profiler(q=True, eventCount=True)):
+        name = cmds.profiler(q=True, eventIndex=i, eventName=True)
+        description = cmds.profiler(q=True, eventIndex=i, eventDescription=True)
+        duration = cmds.profiler(q=True, eventIndex=i, eventDuration=True)
+        events.append([name, description, duration])
+
+    capture = {"rigGroup": rigGroup, "frames": len(frames), "nodes": nodes, "events": events}
+    with open(outputPath, "w") as f:
+        json.dump(capture, f)
+
+    # Parse the saved capture the same way it is read offline
+    report = ribbonProfile.parseRibbonProfile(outputPath)
+    text = ribbonProfile.writeRibbonProfileReport(report, os.path.splitext(outputPath)[0] + "_report.txt")
+    print("\n" + text)
+
+    return report
+
+def createRibbonAttributeHub(hub="Ribbon_Attribute_Hub", snapTarget=None):
+    if cmds.objExists(hub):
+        return hub
+
+    hub = cmds.circle(name=hub, nr=(0, 1, 0), ch=False)[0]
+    if snapTarget and cmds.objExists(snapTarget):
+        cmds.delete(cmds.pointConstraint(snapTarget, hub))
+
+    # Same driver attributes the per-ribbon Attribute ctrls carry
+    for driverAttr in [m[0] for m in SINE_INPUT_MAP + TWIST_INPUT_MAP]:
+        cmds.addAttr(hub, ln=driverAttr, at="float", dv=0, k=True)
+    for switch in ("WaveOFF_ON", "TwistOFF_ON"):
+        cmds.addAttr(hub, ln=switch, at="float", min=0, max=1, dv=0, k=True)
+
+    for s in cmds.listRelatives(hub, shapes=True, type="nurbsCurve") or []:
+        cmds.setAttr(s + ".overrideEnabled", 1)
+        cmds.setAttr(s + ".overrideColor", 17)
+
+    # Lock Translate, Rotate, Scale channels
+    for attr in ["tx","ty","tz","rx","ry","rz","sx","sy","sz"]:
+        cmds.setAttr(f"{hub}.{attr}", lock=True, keyable=False, channelBox=False)
+
+    return hub
+
+# Deformer channels mirrorRibbonRig negates, so each ribbon keeps its own sign off the shared hub
+RIBBON_HUB_SIGNED_ATTRS = ["rotateZ", "startAngle", "endAngle"]
+
+def getDrivenSign(drivenPlug, vEnd):
+    # -1 when the plug's current driver runs against the mapping, as a mirrored ribbon's does
+    sign = 1
+    sources = cmds.listConnections(drivenPlug, source=True, destination=False, plugs=True) or []
+    while sources:
+        node, attr = sources[0].split(".", 1)
+        nodeType = cmds.nodeType(node)
+        if nodeType == "unitConversion":
+            if cmds.getAttr(node + ".conversionFactor") < 0:
+                sign = -sign
+            sources = cmds.listConnections(node + ".input", source=True, destination=False, plugs=True) or []
+            continue
+        if nodeType.startswith("animCurve"):
+            value = (cmds.keyframe(node, q=True, valueChange=True) or [vEnd])[-1]
+        elif nodeType == "remapValue":
+            value = cmds.getAttr(node + ".outputMax")
+        elif nodeType == "setRange":
+            value = cmds.getAttr(f"{node}.max{attr[-1]}")
+        elif nodeType == "multDoubleLinear":
+            # A sign or amplitude mult from an earlier bind
+            value = cmds.getAttr(node + ".input2") * vEnd
+        else:
+            # Driven straight from a control
+            return sign
+        return sign * (-1 if value * vEnd < 0 else 1)
+    return sign
+
+def bindRibbonsToHub(prefixes=("",), hub="Ribbon_Attribute_Hub", phaseOffsets=None, amplitudeScales=None, removeRibbonCtrls=True):
+    # prefixes name each ribbon, "" for a runRibbonRig build and the mirrorRibbonRig prefix for clones
+    # Without explicit offsets/scales a ribbon keeps its current values, and mirrored ribbons get a negative amplitude
+    phaseOffsets = phaseOffsets or [None] * len(prefixes)
+    amplitudeScales = amplitudeScales or [None] * len(prefixes)
+    if len(phaseOffsets) != len(prefixes) or len(amplitudeScales) != len(prefixes):
+        cmds.error(f"Mismatch: {len(prefixes)} ribbons but {len(phaseOffsets)} phase offsets and {len(amplitudeScales)} amplitude scales.")
+    hub = createRibbonAttributeHub(hub, snapTarget=prefixes[0] + "Ctrl_Ribbon_Placement")
+
+    # One shared mapping network on the hub
+    shared = {}
+    for driverAttr, dStart, dEnd, target, drivenAttr, vStart, vEnd in SINE_INPUT_MAP + TWIST_INPUT_MAP:
+        remap = f"{hub}_{driverAttr}_remap"
+        if not cmds.objExists(remap):
+            remap = createLinearRemap(f"{hub}.{driverAttr}", dStart, dEnd, vStart, vEnd, remap)
+        shared[drivenAttr] = remap + ".outValue"
+
+    for prefix, phaseOffset, amplitudeScale in zip(prefixes, phaseOffsets, amplitudeScales):
+        sineHandle = prefix + "RibbonPlane_SineDefHandle"
+        twistHandle = prefix + "RibbonPlane_TwistDefHandle"
+        bsNode = prefix + "c_Ribbon_Plane_BS"
+        placement = prefix + "Ctrl_Ribbon_Placement"
+        for n in [sineHandle, twistHandle, bsNode, placement]:
+            if not cmds.objExists(n):
+                cmds.error(f"Required node '{n}' does NOT exist.")
+
+        sineDef = (cmds.listConnections(sineHandle, type="nonLinear") or [None])[0]
+        twistDef = (cmds.listConnections(twistHandle, type="nonLinear") or [None])[0]
+        if not sineDef or not twistDef:
+            cmds.error(f"Could not find the nonlinear deformers for '{prefix}' ribbon.")
+
+        targets = {"deformer": sineDef, "handle": sineHandle}
+        drivenTargets = [(m, f"{targets[m[3]]}.{m[4]}") for m in SINE_INPUT_MAP]
+        drivenTargets += [(m, f"{twistDef}.{m[4]}") for m in TWIST_INPUT_MAP]
+
+        # Read the mirror signs before the ribbon's own drivers are replaced
+        signs = {m[4]: getDrivenSign(plug, m[6]) for m, plug in drivenTargets
+                 if m[4] in RIBBON_HUB_SIGNED_ATTRS + ["amplitude"]}
+
+        # Per-ribbon phase and amplitude, on the placement control animators already use
+        defaults = {"PhaseOffset": 0, "AmplitudeScale": signs["amplitude"]}
+        for attr, value in [("PhaseOffset", phaseOffset), ("AmplitudeScale", amplitudeScale)]:
+            if not cmds.attributeQuery(attr, node=placement, exists=True):
+                cmds.addAttr(placement, ln=attr, at="float", dv=defaults[attr], k=True)
+            if value is not None:
+                cmds.setAttr(f"{placement}.{attr}", value)
+
+        # Reuse the ribbon's nodes from an earlier bind
+        amplitudeMult = prefix + "Ribbon_AmplitudeScale_mult"
+        if not cmds.objExists(amplitudeMult):
+            amplitudeMult = cmds.createNode("multDoubleLinear", name=amplitudeMult)
+        cmds.connectAttr(shared["amplitude"], amplitudeMult + ".input1", force=True)
+        cmds.connectAttr(placement + ".AmplitudeScale", amplitudeMult + ".input2", force=True)
+        phaseAdd = prefix + "Ribbon_PhaseOffset_add"
+        if not cmds.objExists(phaseAdd):
+            phaseAdd = cmds.createNode("addDoubleLinear", name=phaseAdd)
+        cmds.connectAttr(shared["offset"], phaseAdd + ".input1", force=True)
+        cmds.connectAttr(placement + ".PhaseOffset", phaseAdd + ".input2", force=True)
+
+        sources = dict(shared)
+        sources["amplitude"] = amplitudeMult + ".output"
+        sources["offset"] = phaseAdd + ".output"
+
+        # Mirrored ribbons run the twist and curve direction the other way
+        for attr in RIBBON_HUB_SIGNED_ATTRS:
+            signMult = prefix + f"Ribbon_{attr}_sign_mult"
+            if signs[attr] > 0:
+                continue
+            if not cmds.objExists(signMult):
+                signMult = cmds.createNode("multDoubleLinear", name=signMult)
+            cmds.connectAttr(shared[attr], signMult + ".input1", force=True)
+            cmds.setAttr(signMult + ".input2", -1)
+            sources[attr] = signMult + ".output"
+
+        # Blendshape weights follow the hub switches
+        aliases = cmds.aliasAttr(bsNode, q=True) or []
+        drivenPlugs = []
+        for alias in aliases[0::2]:
+            if alias.endswith("_Sine"):
+                drivenPlugs.append((hub + ".WaveOFF_ON", f"{bsNode}.{alias}"))
+            elif alias.endswith("_Twist"):
+                drivenPlugs.append((hub + ".TwistOFF_ON", f"{bsNode}.{alias}"))
+
+        for m, plug in drivenTargets:
+            drivenPlugs.append((sources[m[4]], plug))
+
+        # Swap the ribbon's own SDK curves or remaps for the hub network
+        oldDrivers = []
+        for source, driven in drivenPlugs:
+            for node in cmds.listConnections(driven, source=True, destination=False, skipConversionNodes=True) or []:
+                if cmds.nodeType(node).startswith("animCurve") or cmds.nodeType(node) in ("remapValue", "setRange"):
+                    oldDrivers.append(node)
+            cmds.connectAttr(source, driven, force=True)
+        oldDrivers = [n for n in set(oldDrivers) if cmds.objExists(n) and not n.startswith(hub)]
+        if oldDrivers:
+            cmds.delete(oldDrivers)
+
+        if removeRibbonCtrls:
+            ribbonCtrls = [prefix + c for c in ("Attribute_Wave_Ctrl", "Attribute_Twist_Ctrl")]
+            ribbonCtrls = [c for c in ribbonCtrls if cmds.objExists(c)]
+            if ribbonCtrls:
+                cmds.delete(ribbonCtrls)
+
+        print(f"Bound {prefix or 'default'} ribbon to {hub}")
+
+    return hub
+
+def rollbackRibbonRig(existingNodes):
+    # Delete every node created since existingNodes (a set of UUIDs) was taken
+    created = [u for u in cmds.ls(uuid=True) or [] if u not in existingNodes]
+    nodes = cmds.ls(created, long=True) or []
+    for node in sorted(nodes, key=lambda n: n.count("|")):
+        if cmds.objExists(node):
+            try:
+                cmds.delete(node)
+            except:
+                pass
+
+def runRibbonRig(weightsFile=None, useRemapNodes=False, progressCallback=None, cancelCallback=None):
     controlCount = countFKControls()
-    plane = createPlane(controlCount)
-    createFollicles(plane, controlCount)
-    createFollicleJoints(controlCount)
-    parentConstraintFKtoFollicleJoints(controlCount)
-    createRibbonControlJoints(controlCount)
-    bindRibbonSkin()
-    importRibbonControl(controlCount)
-    duplicateRibbonControls(controlCount)
-    parentRibbonJoints()
-    importRibbonPlacement()
-    createSineTwistPlanes()
-    importCtrlX()
-    createRibbonSDKs()
-    createSineInputSDKs()
-    createTwistInputSDKs()
-    cleanupRibbonRig()
+
+    # Check every prerequisite before touching the scene
+    problems = preflightRibbonRig(controlCount, weightsFile)
+    if problems:
+        message = "\n".join(problems)
+        if not cmds.about(batch=True):
+            cmds.confirmDialog(title="Pre-flight Error",message=message,button=["OK"],defaultButton="OK")
+        cmds.error("Ribbon rig pre-flight failed:\n" + message)
+
+    plane = "c_Ribbon_Plane"
+    stages = [
+        ("Create plane", lambda: createPlane(controlCount)),
+        ("Create follicles", lambda: createFollicles(plane, controlCount)),
+        ("Create follicle joints", lambda: createFollicleJoints(controlCount)),
+        ("Constrain FK controls", lambda: parentConstraintFKtoFollicleJoints(controlCount)),
+        ("Create ribbon joints", lambda: createRibbonControlJoints(controlCount)),
+        ("Bind skin", lambda: bindRibbonSkin(weightsFile)),
+        ("Import ribbon control", lambda: importRibbonControl(controlCount)),
+        ("Create ribbon controls", lambda: duplicateRibbonControls(controlCount)),
+        ("Parent ribbon joints", lambda: parentRibbonJoints()),
+        ("Import placement control", lambda: importRibbonPlacement()),
+        ("Create sine and twist planes", lambda: createSineTwistPlanes()),
+        ("Import attribute controls", lambda: importCtrlX()),
+        ("Create blendshape SDKs", lambda: createRibbonSDKs(useRemapNodes)),
+        ("Create sine SDKs", lambda: createSineInputSDKs(useRemapNodes)),
+        ("Create twist SDKs", lambda: createTwistInputSDKs(useRemapNodes)),
+        ("Clean up", lambda: cleanupRibbonRig()),
+    ]
+
+    # Progress goes to the callback when given, otherwise to a progress window in the UI
+    chainName = controlCount[-1]
+    showWindow = progressCallback is None and not cmds.about(batch=True)
+    if showWindow:
+        cmds.progressWindow(title="Ribbon Rig", progress=0, maxValue=len(stages), status=chainName, isInterruptable=True)
+
+    # Snapshot of the scene to roll back to
+    existingNodes = set(cmds.ls(uuid=True) or [])
+
+    try:
+        for i, (name, stage) in enumerate(stages):
+            cancelled = cancelCallback() if cancelCallback else False
+            if showWindow and cmds.progressWindow(q=True, isCancelled=True):
+                cancelled = True
+            if cancelled:
+                rollbackRibbonRig(existingNodes)
+                print(f"\nRibbonRig creation cancelled before '{name}', partial rig removed.")
+                return False
+
+            if progressCallback:
+                progressCallback(chainName, i, len(stages), name)
+            if showWindow:
+                cmds.progressWindow(e=True, progress=i, status=f"{chainName}: {name}")
+
+            stage()
+    except:
+        rollbackRibbonRig(existingNodes)
+        raise
+    finally:
+        if showWindow:
+            cmds.progressWindow(endProgress=True)
+
+    if progressCallback:
+        progressCallback(chainName, len(stages), len(stages), "Complete")
     print("\nRibbonRig creation Complete!")
+    return True
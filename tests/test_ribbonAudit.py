@@ -0,0 +1,79 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import pytest
+
+import ribbonAudit
+
+
+class StandInCmds(object):
+    # Just enough of maya.cmds to describe a small built ribbon
+    def __init__(self):
+        self.types = {
+            "RibbonRig": "transform",
+            "|RibbonRig|c_Ribbon_Plane": "transform",
+            "|RibbonRig|c_Ribbon_Plane|c_Ribbon_PlaneShape": "nurbsSurface",
+            "|RibbonRig|c_Follicle_1": "transform",
+            "|RibbonRig|c_Follicle_1|c_Follicle_1Shape": "follicle",
+            "|RibbonRig|hairSystem1": "hairSystem",
+            "c_Ribbon_SkinCluster": "skinCluster",
+            "sine1_amplitude_remap": "remapValue",
+            "fk_1_parentConstraint1": "parentConstraint",
+            "initialShadingGroup": "shadingEngine",
+        }
+        self.attrs = {
+            "|RibbonRig|c_Ribbon_Plane|c_Ribbon_PlaneShape.intermediateObject": False,
+            "|RibbonRig|c_Ribbon_Plane|c_Ribbon_PlaneShape.spansU": 1,
+            "|RibbonRig|c_Ribbon_Plane|c_Ribbon_PlaneShape.degreeU": 3,
+            "|RibbonRig|c_Ribbon_Plane|c_Ribbon_PlaneShape.spansV": 4,
+            "|RibbonRig|c_Ribbon_Plane|c_Ribbon_PlaneShape.degreeV": 3,
+        }
+
+    def error(self, message):
+        raise RuntimeError(message)
+
+    def objExists(self, node):
+        return node in self.types
+
+    def listRelatives(self, node, allDescendents=False, fullPath=False):
+        return [n for n in self.types if n.startswith("|" + node + "|")]
+
+    def listHistory(self, nodes, pruneDagObjects=False):
+        return ["c_Ribbon_SkinCluster", "sine1_amplitude_remap"]
+
+    def listConnections(self, nodes, source=True, destination=True):
+        return ["fk_1_parentConstraint1", "initialShadingGroup"]
+
+    def ls(self, nodes, showType=False):
+        typed = []
+        for node in sorted(nodes):
+            typed += [node, self.types[node]]
+        return typed
+
+    def getAttr(self, plug):
+        return self.attrs[plug]
+
+
+def test_audit_counts_flags_and_costs_stand_in_rig():
+    report = ribbonAudit.auditRibbonRig(backend=StandInCmds())
+
+    assert report["typeCounts"]["follicle"] == 1
+    assert report["typeCounts"]["parentConstraint"] == 1
+    assert "shadingEngine" not in report["typeCounts"]
+    assert report["surfaceCVs"] == 28
+    assert [f[1] for f in report["flagged"]] == ["hairSystem"]
+    assert report["estimatedCost"] > 0
+    assert not report["overBudget"]
+
+
+def test_audit_budget():
+    report = ribbonAudit.auditRibbonRig(maxCost=0.5, backend=StandInCmds())
+
+    assert report["overBudget"]
+
+
+def test_audit_missing_rig():
+    with pytest.raises(RuntimeError):
+        ribbonAudit.auditRibbonRig(rigGroup="Missing", backend=StandInCmds())
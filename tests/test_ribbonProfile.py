@@ -0,0 +1,63 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import pytest
+
+import ribbonProfile
+
+
+CAPTURE = {
+    "rigGroup": "RibbonRig",
+    "frames": 2,
+    "nodes": {
+        "c_Follicle_1Shape": "follicle attachment",
+        "c_Ribbon_SkinCluster": "skin",
+        "c_Ribbon_Plane_Sine": "sine/twist",
+    },
+    # name, description, duration in microseconds
+    "events": [
+        ["c_Follicle_1Shape", "", 1000],
+        ["", "c_Ribbon_SkinCluster.outputGeometry", 3000],
+        ["EvaluationManager", "|RibbonRig|c_Ribbon_Plane_Sine", 2000],
+        ["c_Follicle_1Shape", "", 1000],
+        ["persp", "", 5000],
+    ],
+}
+
+
+@pytest.fixture
+def capturePath(tmp_path):
+    path = tmp_path / "ribbon_profile.json"
+    path.write_text(json.dumps(CAPTURE))
+    return str(path)
+
+
+def test_parse_sums_stages_nodes_and_fps(capturePath):
+    report = ribbonProfile.parseRibbonProfile(capturePath)
+
+    assert report["frames"] == 2
+    assert report["msPerFrame"] == pytest.approx(3.5)
+    assert report["fps"] == pytest.approx(1000.0 / 3.5)
+    assert report["stages"]["follicle attachment"] == pytest.approx(1.0)
+    assert report["stages"]["skin"] == pytest.approx(1.5)
+    assert report["stages"]["sine/twist"] == pytest.approx(1.0)
+    assert report["stages"]["other"] == 0
+    assert report["nodes"] == pytest.approx({"c_Follicle_1Shape": 1.0, "c_Ribbon_SkinCluster": 1.5, "c_Ribbon_Plane_Sine": 1.0})
+
+
+def test_report_lists_slowest_node_first(capturePath):
+    text = ribbonProfile.formatRibbonProfileReport(ribbonProfile.parseRibbonProfile(capturePath), topNodes=1)
+
+    assert text.splitlines()[0] == "RibbonRig: 3.500 ms/frame over 2 frames (285.7 fps)"
+    assert text.splitlines()[-1] == "    c_Ribbon_SkinCluster: 1.500"
+
+
+def test_classify_ribbon_nodes():
+    assert ribbonProfile.classifyRibbonNode("c_Follicle_1Shape", "follicle") == "follicle attachment"
+    assert ribbonProfile.classifyRibbonNode("fk_1_parentConstraint1", "parentConstraint") == "constraints/space switch"
+    assert ribbonProfile.classifyRibbonNode("sine1", "nonLinear") == "sine/twist"
+    assert ribbonProfile.classifyRibbonNode("c_Ribbon_SkinCluster", "skinCluster") == "skin"
+    assert ribbonProfile.classifyRibbonNode("hairSystem1", "hairSystem") == "other"
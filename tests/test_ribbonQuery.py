@@ -0,0 +1,58 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import ribbonQuery
+
+
+class StandInCmds(object):
+    # Just enough of maya.cmds to describe an FK chain and a follicle
+    def __init__(self):
+        self.parents = {"fk_2": "fk_1", "fk_1": "spine_grp", "spine_grp": None, "c_Follicle_1": None}
+        self.shapes = {"fk_2": ["fk_2Shape"], "fk_1": ["fk_1Shape"], "c_Follicle_1": ["|c_Follicle_1|c_Follicle_1Shape"]}
+        self.types = {"fk_1": "transform", "fk_1Shape": "nurbsCurve", "c_Follicle_1Shape": "follicle"}
+        self.bboxes = {"fk_1Shape": [-1.0, 4.0, -1.0, 1.0, 4.0, 1.0], "fk_2Shape": [-0.5, 8.0, -0.5, 0.5, 8.0, 0.5]}
+        self.attrs = {"|c_Follicle_1|c_Follicle_1Shape.parameterV": 0.25}
+
+    def listRelatives(self, node, shapes=False, parent=False, type=None, fullPath=False):
+        if parent:
+            return [self.parents[node]] if self.parents.get(node) else None
+        return self.shapes.get(node)
+
+    def exactWorldBoundingBox(self, shape):
+        return self.bboxes[shape]
+
+    def getAttr(self, plug):
+        return self.attrs[plug]
+
+    def nodeType(self, node):
+        return self.types[node]
+
+
+def test_query_ancestry_walks_to_root():
+    ancestry = ribbonQuery.queryAncestry("fk_2", backend=StandInCmds())
+
+    assert ancestry == [("fk_2", True), ("fk_1", True), ("spine_grp", False)]
+
+
+def test_query_curve_bounding_boxes():
+    bboxes = ribbonQuery.queryCurveBoundingBoxes(["fk_1", "fk_2"], backend=StandInCmds())
+
+    assert bboxes == [[-1.0, 4.0, -1.0, 1.0, 4.0, 1.0], [-0.5, 8.0, -0.5, 0.5, 8.0, 0.5]]
+
+
+def test_query_follicle_parameter_v():
+    assert ribbonQuery.queryFollicleParameterV(["c_Follicle_1"], backend=StandInCmds()) == [0.25]
+
+
+def test_query_node_types_keeps_repeats():
+    types = ribbonQuery.queryNodeTypes(["fk_1", "fk_1Shape", "fk_1"], backend=StandInCmds())
+
+    assert types == ["transform", "nurbsCurve", "transform"]
+
+
+def test_stand_in_never_imports_maya():
+    ribbonQuery.queryNodeTypes(["fk_1"], backend=StandInCmds())
+
+    assert "maya" not in sys.modules